@@ -179,12 +179,13 @@ namespace SEALNetExamples
 
             /*
             We decrypt and decompose the plaintext to recover the result as a matrix.
+            The plaintext plainMatrix is no longer needed, so we decrypt into it and
+            reuse its memory instead of allocating a new Plaintext.
             */
-            using Plaintext plainResult = new Plaintext();
             Utilities.PrintLine();
             Console.WriteLine("Decrypt and decode result.");
-            decryptor.Decrypt(encryptedMatrix, plainResult);
-            batchEncoder.Decode(plainResult, podResult);
+            decryptor.Decrypt(encryptedMatrix, plainMatrix);
+            batchEncoder.Decode(plainMatrix, podResult);
             Console.WriteLine("    + Result plaintext matrix ...... Correct.");
             Utilities.PrintMatrix(podResult, (int)rowSize);
 
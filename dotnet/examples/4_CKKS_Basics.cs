@@ -92,9 +92,14 @@ namespace SEALNetExamples
 
             using KeyGenerator keygen = new KeyGenerator(context);
             using SecretKey secretKey = keygen.SecretKey;
-            keygen.CreatePublicKey(out PublicKey publicKey);
             keygen.CreateRelinKeys(out RelinKeys relinKeys);
-            using Encryptor encryptor = new Encryptor(context, publicKey);
+
+            /*
+            We decrypt the result locally, so there is no need for a public key here.
+            Encrypting with the secret key (Encryptor.EncryptSymmetric) is cheaper
+            than public-key encryption.
+            */
+            using Encryptor encryptor = new Encryptor(context, secretKey);
             using Evaluator evaluator = new Evaluator(context);
             using Decryptor decryptor = new Decryptor(context, secretKey);
 
@@ -129,7 +134,7 @@ namespace SEALNetExamples
             Console.WriteLine("Encode input vectors.");
             encoder.Encode(input, scale, xPlain);
             using Ciphertext x1Encrypted = new Ciphertext();
-            encryptor.Encrypt(xPlain, x1Encrypted);
+            encryptor.EncryptSymmetric(xPlain, x1Encrypted);
 
             /*
             To compute x^3 we first compute x^2 and relinearize. However, the scale has
@@ -72,9 +72,13 @@ namespace SEALNetExamples
 
             /*
             Rotations require yet another type of special key called `Galois keys'. These
-            are easily obtained from the KeyGenerator.
+            are easily obtained from the KeyGenerator. By default keys are generated for
+            all power-of-two steps, but since we know exactly which rotations we need, we
+            only generate keys for those: 3 and -4 row steps, and a column rotation,
+            which is denoted by a step count of zero. This is much faster and uses far
+            less memory.
             */
-            keygen.CreateGaloisKeys(out GaloisKeys galoisKeys);
+            keygen.CreateGaloisKeys(new int[] { 3, -4, 0 }, out GaloisKeys galoisKeys);
 
             /*
             Now rotate both matrix rows 3 steps to the left, decrypt, decode, and print.
@@ -145,7 +149,11 @@ namespace SEALNetExamples
             using SecretKey secretKey = keygen.SecretKey;
             keygen.CreatePublicKey(out PublicKey publicKey);
             keygen.CreateRelinKeys(out RelinKeys relinKeys);
-            keygen.CreateGaloisKeys(out GaloisKeys galoisKeys);
+
+            /*
+            We only need a key for rotating by 2 steps.
+            */
+            keygen.CreateGaloisKeys(new int[] { 2 }, out GaloisKeys galoisKeys);
             using Encryptor encryptor = new Encryptor(context, publicKey);
             using Evaluator evaluator = new Evaluator(context);
             using Decryptor decryptor = new Decryptor(context, secretKey);
@@ -103,7 +103,8 @@ namespace Microsoft.Research.SEAL
             if (null == destination)
                 throw new ArgumentNullException(nameof(destination));
 
-            ulong[] valarray = values.ToArray();
+            // Avoid an extra copy when the caller already passes an array
+            ulong[] valarray = values as ulong[] ?? values.ToArray();
             NativeMethods.BatchEncoder_Encode(NativePtr, (ulong)valarray.LongLength, valarray, destination.NativePtr);
         }
 
@@ -133,7 +134,8 @@ namespace Microsoft.Research.SEAL
             if (null == destination)
                 throw new ArgumentNullException(nameof(destination));
 
-            long[] valarray = values.ToArray();
+            // Avoid an extra copy when the caller already passes an array
+            long[] valarray = values as long[] ?? values.ToArray();
             NativeMethods.BatchEncoder_Encode(NativePtr, (ulong)valarray.LongLength, valarray, destination.NativePtr);
         }
 
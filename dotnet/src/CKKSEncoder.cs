@@ -92,7 +92,8 @@ namespace Microsoft.Research.SEAL
                 throw new ArgumentNullException(nameof(destination));
 
             IntPtr poolPtr = pool?.NativePtr ?? IntPtr.Zero;
-            double[] valuearray = values.ToArray();
+            // Avoid an extra copy when the caller already passes an array
+            double[] valuearray = values as double[] ?? values.ToArray();
             NativeMethods.CKKSEncoder_EncodeDouble(NativePtr, (ulong)valuearray.LongLength, valuearray,
                 parmsId.Block, scale, destination.NativePtr, poolPtr);
         }
@@ -323,7 +323,8 @@ namespace Microsoft.Research.SEAL
             if (null == coeffs)
                 throw new ArgumentNullException(nameof(coeffs));
 
-            ulong[] coeffArr = coeffs.ToArray();
+            // Avoid an extra copy when the caller already passes an array
+            ulong[] coeffArr = coeffs as ulong[] ?? coeffs.ToArray();
             NativeMethods.Plaintext_Set(NativePtr, (ulong)coeffArr.LongLength, coeffArr);
         }
 
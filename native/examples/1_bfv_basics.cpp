@@ -160,7 +160,7 @@ void example_bfv_basics()
     this in `6_serialization.cpp'.
     */
     KeyGenerator keygen(context);
-    SecretKey secret_key = keygen.secret_key();
+    const SecretKey &secret_key = keygen.secret_key();
     PublicKey public_key;
     keygen.create_public_key(public_key);
 
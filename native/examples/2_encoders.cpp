@@ -68,7 +68,7 @@ void example_batch_encoder()
     cout << "Batching enabled: " << boolalpha << qualifiers.using_batching << endl;
 
     KeyGenerator keygen(context);
-    SecretKey secret_key = keygen.secret_key();
+    const SecretKey &secret_key = keygen.secret_key();
     PublicKey public_key;
     keygen.create_public_key(public_key);
     RelinKeys relin_keys;
@@ -149,10 +149,10 @@ void example_batch_encoder()
 
     and encode it into a plaintext.
     */
-    vector<uint64_t> pod_matrix2;
+    vector<uint64_t> pod_matrix2(slot_count);
     for (size_t i = 0; i < slot_count; i++)
     {
-        pod_matrix2.push_back((i & size_t(0x1)) + 1);
+        pod_matrix2[i] = (i & size_t(0x1)) + 1;
     }
     Plaintext plain_matrix2;
     batch_encoder.encode(pod_matrix2, plain_matrix2);
@@ -177,12 +177,13 @@ void example_batch_encoder()
 
     /*
     We decrypt and decompose the plaintext to recover the result as a matrix.
+    The plaintext plain_matrix is no longer needed, so we decrypt into it and
+    reuse its memory instead of allocating a new Plaintext.
     */
-    Plaintext plain_result;
     print_line(__LINE__);
     cout << "Decrypt and decode result." << endl;
-    decryptor.decrypt(encrypted_matrix, plain_result);
-    batch_encoder.decode(plain_result, pod_result);
+    decryptor.decrypt(encrypted_matrix, plain_matrix);
+    batch_encoder.decode(plain_matrix, pod_result);
     cout << "    + Result plaintext matrix ...... Correct." << endl;
     print_matrix(pod_result, row_size);
 
@@ -233,7 +234,7 @@ void example_ckks_encoder()
     Keys are created the same way as for the BFV scheme.
     */
     KeyGenerator keygen(context);
-    auto secret_key = keygen.secret_key();
+    const auto &secret_key = keygen.secret_key();
     PublicKey public_key;
     keygen.create_public_key(public_key);
     RelinKeys relin_keys;
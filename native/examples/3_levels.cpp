@@ -164,7 +164,7 @@ void example_levels()
     We create some keys and check that indeed they appear at the highest level.
     */
     KeyGenerator keygen(context);
-    auto secret_key = keygen.secret_key();
+    const auto &secret_key = keygen.secret_key();
     PublicKey public_key;
     keygen.create_public_key(public_key);
     RelinKeys relin_keys;
@@ -87,14 +87,16 @@ void example_ckks_basics()
     cout << endl;
 
     KeyGenerator keygen(context);
-    auto secret_key = keygen.secret_key();
-    PublicKey public_key;
-    keygen.create_public_key(public_key);
+    const auto &secret_key = keygen.secret_key();
     RelinKeys relin_keys;
     keygen.create_relin_keys(relin_keys);
-    GaloisKeys gal_keys;
-    keygen.create_galois_keys(gal_keys);
-    Encryptor encryptor(context, public_key);
+
+    /*
+    We decrypt the result locally, so there is no need for a public key here.
+    Encrypting with the secret key (Encryptor::encrypt_symmetric) is cheaper
+    than public-key encryption.
+    */
+    Encryptor encryptor(context, secret_key);
     Evaluator evaluator(context);
     Decryptor decryptor(context, secret_key);
 
@@ -130,7 +132,7 @@ void example_ckks_basics()
     cout << "Encode input vectors." << endl;
     encoder.encode(input, scale, x_plain);
     Ciphertext x1_encrypted;
-    encryptor.encrypt(x_plain, x1_encrypted);
+    encryptor.encrypt_symmetric(x_plain, x1_encrypted);
 
     /*
     To compute x^3 we first compute x^2 and relinearize. However, the scale has
@@ -292,11 +294,11 @@ void example_ckks_basics()
     print_line(__LINE__);
     cout << "Decrypt and decode PI*x^3 + 0.4x + 1." << endl;
     cout << "    + Expected result:" << endl;
-    vector<double> true_result;
+    vector<double> true_result(input.size());
     for (size_t i = 0; i < input.size(); i++)
     {
         double x = input[i];
-        true_result.push_back((3.14159265 * x * x + 0.4) * x + 1);
+        true_result[i] = (3.14159265 * x * x + 0.4) * x + 1;
     }
     print_vector(true_result, 3, 7);
 
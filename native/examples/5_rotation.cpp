@@ -27,7 +27,7 @@ void example_rotation_bfv()
     cout << endl;
 
     KeyGenerator keygen(context);
-    SecretKey secret_key = keygen.secret_key();
+    const SecretKey &secret_key = keygen.secret_key();
     PublicKey public_key;
     keygen.create_public_key(public_key);
     RelinKeys relin_keys;
@@ -70,10 +70,14 @@ void example_rotation_bfv()
 
     /*
     Rotations require yet another type of special key called `Galois keys'. These
-    are easily obtained from the KeyGenerator.
+    are easily obtained from the KeyGenerator. By default keys are generated for
+    all power-of-two steps, but since we know exactly which rotations we need, we
+    only generate keys for those: 3 and -4 row steps, and a column rotation,
+    which is denoted by a step count of zero. This is much faster and uses far
+    less memory.
     */
     GaloisKeys galois_keys;
-    keygen.create_galois_keys(galois_keys);
+    keygen.create_galois_keys(vector<int>{ 3, -4, 0 }, galois_keys);
 
     /*
     Now rotate both matrix rows 3 steps to the left, decrypt, decode, and print.
@@ -142,13 +146,16 @@ void example_rotation_ckks()
     cout << endl;
 
     KeyGenerator keygen(context);
-    SecretKey secret_key = keygen.secret_key();
+    const SecretKey &secret_key = keygen.secret_key();
     PublicKey public_key;
     keygen.create_public_key(public_key);
     RelinKeys relin_keys;
     keygen.create_relin_keys(relin_keys);
+    /*
+    We only need a key for rotating by 2 steps.
+    */
     GaloisKeys galois_keys;
-    keygen.create_galois_keys(galois_keys);
+    keygen.create_galois_keys(vector<int>{ 2 }, galois_keys);
     Encryptor encryptor(context, public_key);
     Evaluator evaluator(context);
     Decryptor decryptor(context, secret_key);
@@ -229,7 +229,7 @@ void example_serialization()
         SEALContext context(parms);
 
         KeyGenerator keygen(context);
-        auto sk = keygen.secret_key();
+        const auto &sk = keygen.secret_key();
         PublicKey pk;
         keygen.create_public_key(pk);
 
@@ -21,7 +21,7 @@ void bfv_performance_test(SEALContext context)
     KeyGenerator keygen(context);
     cout << "Done" << endl;
 
-    auto secret_key = keygen.secret_key();
+    const auto &secret_key = keygen.secret_key();
     PublicKey public_key;
     keygen.create_public_key(public_key);
 
@@ -357,7 +357,7 @@ void ckks_performance_test(SEALContext context)
     KeyGenerator keygen(context);
     cout << "Done" << endl;
 
-    auto secret_key = keygen.secret_key();
+    const auto &secret_key = keygen.secret_key();
     PublicKey public_key;
     keygen.create_public_key(public_key);
 
@@ -9,6 +9,17 @@ using namespace seal;
 int main()
 {
     cout << "Microsoft SEAL version: " << SEAL_VERSION << endl;
+
+    /*
+    Report whether the library was built with SEAL_USE_INTEL_HEXL=ON. When it is,
+    NTTs and element-wise modular arithmetic in all examples run through Intel
+    HEXL, which is much faster on processors supporting AVX512-IFMA52.
+    */
+#ifdef SEAL_USE_INTEL_HEXL
+    cout << "Intel HEXL acceleration: enabled" << endl;
+#else
+    cout << "Intel HEXL acceleration: disabled" << endl;
+#endif
     while (true)
     {
         cout << "+---------------------------------------------------------+" << endl;
@@ -6,18 +6,15 @@
 #include "seal/seal.h"
 #include <algorithm>
 #include <chrono>
+#include <cmath>
 #include <cstddef>
-#include <fstream>
 #include <iomanip>
 #include <iostream>
 #include <limits>
 #include <memory>
-#include <mutex>
-#include <numeric>
 #include <random>
 #include <sstream>
 #include <string>
-#include <thread>
 #include <vector>
 
 void example_bfv_basics();
@@ -105,21 +102,23 @@ inline void print_parameters(const seal::SEALContext &context)
 /*
 Helper function: Prints the `parms_id' to std::ostream.
 */
-inline std::ostream &operator<<(std::ostream &stream, seal::parms_id_type parms_id)
+inline std::ostream &operator<<(std::ostream &stream, const seal::parms_id_type &parms_id)
 {
     /*
-    Save the formatting information for std::cout.
+    Save only the formatting state we change; this is cheaper than copying the
+    full stream format with copyfmt.
     */
-    std::ios old_fmt(nullptr);
-    old_fmt.copyfmt(std::cout);
+    std::ios_base::fmtflags old_flags = stream.flags();
+    char old_fill = stream.fill();
 
     stream << std::hex << std::setfill('0') << std::setw(16) << parms_id[0] << " " << std::setw(16) << parms_id[1]
            << " " << std::setw(16) << parms_id[2] << " " << std::setw(16) << parms_id[3] << " ";
 
     /*
-    Restore the old std::cout formatting.
+    Restore the old formatting of the stream.
     */
-    std::cout.copyfmt(old_fmt);
+    stream.flags(old_flags);
+    stream.fill(old_fill);
 
     return stream;
 }
@@ -128,7 +127,7 @@ inline std::ostream &operator<<(std::ostream &stream, seal::parms_id_type parms_
 Helper function: Prints a vector of floating-point values.
 */
 template <typename T>
-inline void print_vector(std::vector<T> vec, std::size_t print_size = 4, int prec = 3)
+inline void print_vector(const std::vector<T> &vec, std::size_t print_size = 4, int prec = 3)
 {
     /*
     Save the formatting information for std::cout.
@@ -150,7 +149,6 @@ inline void print_vector(std::vector<T> vec, std::size_t print_size = 4, int pre
     }
     else
     {
-        vec.resize(std::max(vec.size(), 2 * print_size));
         std::cout << "    [";
         for (std::size_t i = 0; i < print_size; i++)
         {
@@ -177,7 +175,7 @@ inline void print_vector(std::vector<T> vec, std::size_t print_size = 4, int pre
 Helper function: Prints a matrix of values.
 */
 template <typename T>
-inline void print_matrix(std::vector<T> matrix, std::size_t row_size)
+inline void print_matrix(const std::vector<T> &matrix, std::size_t row_size)
 {
     /*
     We're not going to print every column of the matrix (there are 2048). Instead
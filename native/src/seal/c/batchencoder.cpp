@@ -2,6 +2,7 @@
 // Licensed under the MIT license.
 
 // STD
+#include <algorithm>
 #include <vector>
 
 // SEALNet
@@ -50,11 +51,7 @@ SEAL_C_FUNC BatchEncoder_Encode1(void *thisptr, uint64_t count, uint64_t *values
     Plaintext *plain = FromVoid<Plaintext>(destination);
     IfNullRet(plain, E_POINTER);
 
-    vector<uint64_t> valvec(count);
-    for (uint64_t i = 0; i < count; i++)
-    {
-        valvec[i] = values[i];
-    }
+    vector<uint64_t> valvec(values, values + count);
 
     try
     {
@@ -75,11 +72,7 @@ SEAL_C_FUNC BatchEncoder_Encode2(void *thisptr, uint64_t count, int64_t *values,
     Plaintext *plain = FromVoid<Plaintext>(destination);
     IfNullRet(plain, E_POINTER);
 
-    vector<int64_t> valvec(count);
-    for (uint64_t i = 0; i < count; i++)
-    {
-        valvec[i] = values[i];
-    }
+    vector<int64_t> valvec(values, values + count);
 
     try
     {
@@ -102,6 +95,20 @@ SEAL_C_FUNC BatchEncoder_Decode1(void *thisptr, void *plain, uint64_t *count, ui
     IfNullRet(plainptr, E_POINTER);
     unique_ptr<MemoryPoolHandle> handle = MemHandleFromVoid(pool);
 
+#ifdef SEAL_USE_MSGSL
+    // Decode directly into the caller's buffer, which has room for slot_count values
+    size_t slot_count = encoder->slot_count();
+    try
+    {
+        encoder->decode(*plainptr, gsl::span<uint64_t>(destination, slot_count), *handle);
+    }
+    catch (const invalid_argument &)
+    {
+        return E_INVALIDARG;
+    }
+
+    *count = slot_count;
+#else
     vector<uint64_t> result;
     try
     {
@@ -114,11 +121,8 @@ SEAL_C_FUNC BatchEncoder_Decode1(void *thisptr, void *plain, uint64_t *count, ui
 
     // Copy to actual destination
     *count = result.size();
-
-    for (uint64_t i = 0; i < *count; i++)
-    {
-        destination[i] = result[i];
-    }
+    copy(result.begin(), result.end(), destination);
+#endif
 
     return S_OK;
 }
@@ -133,6 +137,20 @@ SEAL_C_FUNC BatchEncoder_Decode2(void *thisptr, void *plain, uint64_t *count, in
     IfNullRet(plainptr, E_POINTER);
     unique_ptr<MemoryPoolHandle> handle = MemHandleFromVoid(pool);
 
+#ifdef SEAL_USE_MSGSL
+    // Decode directly into the caller's buffer, which has room for slot_count values
+    size_t slot_count = encoder->slot_count();
+    try
+    {
+        encoder->decode(*plainptr, gsl::span<int64_t>(destination, slot_count), *handle);
+    }
+    catch (const invalid_argument &)
+    {
+        return E_INVALIDARG;
+    }
+
+    *count = slot_count;
+#else
     vector<int64_t> result;
     try
     {
@@ -143,13 +161,10 @@ SEAL_C_FUNC BatchEncoder_Decode2(void *thisptr, void *plain, uint64_t *count, in
         return E_INVALIDARG;
     }
 
-    *count = result.size();
-
     // Copy to actual destination
-    for (uint64_t i = 0; i < *count; i++)
-    {
-        destination[i] = result[i];
-    }
+    *count = result.size();
+    copy(result.begin(), result.end(), destination);
+#endif
 
     return S_OK;
 }
@@ -2,6 +2,7 @@
 // Licensed under the MIT license.
 
 // STD
+#include <algorithm>
 #include <vector>
 
 // SEALNet
@@ -57,11 +58,7 @@ SEAL_C_FUNC CKKSEncoder_Encode1(
     parms_id_type parms;
     CopyParmsId(parms_id, parms);
 
-    vector<double> input(value_count);
-    for (uint64_t i = 0; i < value_count; i++)
-    {
-        input[i] = values[i];
-    }
+    vector<double> input(values, values + value_count);
 
     try
     {
@@ -89,11 +86,9 @@ SEAL_C_FUNC CKKSEncoder_Encode2(
     parms_id_type parms;
     CopyParmsId(parms_id, parms);
 
-    vector<complex<double>> input(value_count);
-    for (uint64_t i = 0; i < value_count; i++)
-    {
-        input[i] = complex<double>(complex_values[i * 2], complex_values[i * 2 + 1]);
-    }
+    // Interleaved real and imaginary parts have the layout of std::complex<double>
+    const complex<double> *complex_values_begin = reinterpret_cast<const complex<double> *>(complex_values);
+    vector<complex<double>> input(complex_values_begin, complex_values_begin + value_count);
 
     try
     {
@@ -192,6 +187,20 @@ SEAL_C_FUNC CKKSEncoder_Decode1(void *thisptr, void *plain, uint64_t *value_coun
     IfNullRet(plainptr, E_POINTER);
     unique_ptr<MemoryPoolHandle> handle = MemHandleFromVoid(pool);
 
+#ifdef SEAL_USE_MSGSL
+    // Decode directly into the caller's buffer, which has room for slot_count values
+    size_t slot_count = encoder->slot_count();
+    try
+    {
+        encoder->decode(*plainptr, gsl::span<double>(values, slot_count), *handle);
+    }
+    catch (const invalid_argument &)
+    {
+        return E_INVALIDARG;
+    }
+
+    *value_count = slot_count;
+#else
     vector<double> destination;
 
     try
@@ -206,10 +215,8 @@ SEAL_C_FUNC CKKSEncoder_Decode1(void *thisptr, void *plain, uint64_t *value_coun
     *value_count = destination.size();
 
     // Copy to actual destination
-    for (uint64_t i = 0; i < destination.size(); i++)
-    {
-        values[i] = destination[i];
-    }
+    copy(destination.begin(), destination.end(), values);
+#endif
 
     return S_OK;
 }
@@ -225,6 +232,22 @@ SEAL_C_FUNC CKKSEncoder_Decode2(void *thisptr, void *plain, uint64_t *value_coun
     IfNullRet(plainptr, E_POINTER);
     unique_ptr<MemoryPoolHandle> handle = MemHandleFromVoid(pool);
 
+#ifdef SEAL_USE_MSGSL
+    // Decode directly into the caller's buffer, which has room for slot_count complex values stored as
+    // interleaved real and imaginary parts; this is the layout of std::complex<double>
+    size_t slot_count = encoder->slot_count();
+    try
+    {
+        encoder->decode(
+            *plainptr, gsl::span<complex<double>>(reinterpret_cast<complex<double> *>(values), slot_count), *handle);
+    }
+    catch (const invalid_argument &)
+    {
+        return E_INVALIDARG;
+    }
+
+    *value_count = slot_count;
+#else
     vector<complex<double>> destination;
 
     try
@@ -244,6 +267,7 @@ SEAL_C_FUNC CKKSEncoder_Decode2(void *thisptr, void *plain, uint64_t *value_coun
         values[i * 2] = destination[i].real();
         values[i * 2 + 1] = destination[i].imag();
     }
+#endif
 
     return S_OK;
 }
@@ -26,8 +26,8 @@ namespace seal
         is_ntt_form_ = assign.is_ntt_form_;
         scale_ = assign.scale_;
 
-        // Then resize
-        resize_internal(assign.size_, assign.poly_modulus_degree_, assign.coeff_modulus_size_);
+        // Then resize; no need to zero the new data since it is overwritten below
+        resize_internal(assign.size_, assign.poly_modulus_degree_, assign.coeff_modulus_size_, false);
 
         // Size is guaranteed to be OK now so copy over
         copy(assign.data_.cbegin(), assign.data_.cend(), data_.begin());
@@ -97,7 +97,7 @@ namespace seal
         resize_internal(size, parms.poly_modulus_degree(), parms.coeff_modulus().size());
     }
 
-    void Ciphertext::resize_internal(size_t size, size_t poly_modulus_degree, size_t coeff_modulus_size)
+    void Ciphertext::resize_internal(size_t size, size_t poly_modulus_degree, size_t coeff_modulus_size, bool fill_zero)
     {
         if ((size < SEAL_CIPHERTEXT_SIZE_MIN && size != 0) || size > SEAL_CIPHERTEXT_SIZE_MAX)
         {
@@ -106,7 +106,7 @@ namespace seal
 
         // Resize the data
         size_t new_data_size = mul_safe(size, poly_modulus_degree, coeff_modulus_size);
-        data_.resize(new_data_size);
+        data_.resize(new_data_size, fill_zero);
 
         // Set the size parameters
         size_ = size;
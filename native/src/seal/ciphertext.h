@@ -669,7 +669,8 @@ namespace seal
         void reserve_internal(
             std::size_t size_capacity, std::size_t poly_modulus_degree, std::size_t coeff_modulus_size);
 
-        void resize_internal(std::size_t size, std::size_t poly_modulus_degree, std::size_t coeff_modulus_size);
+        void resize_internal(
+            std::size_t size, std::size_t poly_modulus_degree, std::size_t coeff_modulus_size, bool fill_zero = true);
 
         void expand_seed(const SEALContext &context, const UniformRandomGeneratorInfo &prng_info, SEALVersion version);
 
@@ -962,8 +962,9 @@ namespace seal
         }
     }
 
-    void Evaluator::mod_switch_drop_to_next(
-        const Ciphertext &encrypted, Ciphertext &destination, MemoryPoolHandle pool) const
+    void Evaluator::mod_switch_drop_to(
+        const Ciphertext &encrypted, Ciphertext &destination, const SEALContext::ContextData &target_context_data,
+        MemoryPoolHandle pool) const
     {
         // Assuming at this point encrypted is already validated.
         auto context_data_ptr = context_.get_context_data(encrypted.parms_id());
@@ -973,21 +974,20 @@ namespace seal
         }
 
         // Extract encryption parameters.
-        auto &next_context_data = *context_data_ptr->next_context_data();
-        auto &next_parms = next_context_data.parms();
+        auto &target_parms = target_context_data.parms();
 
-        if (!is_scale_within_bounds(encrypted.scale(), next_context_data))
+        if (!is_scale_within_bounds(encrypted.scale(), target_context_data))
         {
             throw invalid_argument("scale out of bounds");
         }
 
-        // q_1,...,q_{k-1}
-        size_t next_coeff_modulus_size = next_parms.coeff_modulus().size();
-        size_t coeff_count = next_parms.poly_modulus_degree();
+        // q_1,...,q_l for the target level; multiple levels are dropped in a single pass
+        size_t target_coeff_modulus_size = target_parms.coeff_modulus().size();
+        size_t coeff_count = target_parms.poly_modulus_degree();
         size_t encrypted_size = encrypted.size();
 
         // Size check
-        if (!product_fits_in(encrypted_size, coeff_count, next_coeff_modulus_size))
+        if (!product_fits_in(encrypted_size, coeff_count, target_coeff_modulus_size))
         {
             throw logic_error("invalid parameters");
         }
@@ -995,30 +995,30 @@ namespace seal
         auto drop_modulus_and_copy = [&](ConstPolyIter in_iter, PolyIter out_iter) {
             SEAL_ITERATE(iter(in_iter, out_iter), encrypted_size, [&](auto I) {
                 SEAL_ITERATE(
-                    iter(I), next_coeff_modulus_size, [&](auto J) { set_uint(get<0>(J), coeff_count, get<1>(J)); });
+                    iter(I), target_coeff_modulus_size, [&](auto J) { set_uint(get<0>(J), coeff_count, get<1>(J)); });
             });
         };
 
         if (&encrypted == &destination)
         {
             // Switching in-place so need temporary space
-            SEAL_ALLOCATE_GET_POLY_ITER(temp, encrypted_size, coeff_count, next_coeff_modulus_size, pool);
+            SEAL_ALLOCATE_GET_POLY_ITER(temp, encrypted_size, coeff_count, target_coeff_modulus_size, pool);
 
             // Copy data over to temp; only copy the RNS components relevant after modulus drop
             drop_modulus_and_copy(encrypted, temp);
 
             // Resize destination before writing
-            destination.resize(context_, next_context_data.parms_id(), encrypted_size);
+            destination.resize(context_, target_context_data.parms_id(), encrypted_size);
             destination.is_ntt_form() = true;
             destination.scale() = encrypted.scale();
 
             // Copy data to destination
-            set_poly_array(temp, encrypted_size, coeff_count, next_coeff_modulus_size, destination.data());
+            set_poly_array(temp, encrypted_size, coeff_count, target_coeff_modulus_size, destination.data());
         }
         else
         {
             // Resize destination before writing
-            destination.resize(context_, next_context_data.parms_id(), encrypted_size);
+            destination.resize(context_, target_context_data.parms_id(), encrypted_size);
             destination.is_ntt_form() = true;
             destination.scale() = encrypted.scale();
 
@@ -1090,7 +1090,7 @@ namespace seal
 
         case scheme_type::ckks:
             // Modulus switching without scaling
-            mod_switch_drop_to_next(encrypted, destination, move(pool));
+            mod_switch_drop_to(encrypted, destination, *context_data_ptr->next_context_data(), move(pool));
             break;
 
         default:
@@ -1123,6 +1123,34 @@ namespace seal
             throw invalid_argument("cannot switch to higher level modulus");
         }
 
+        if (encrypted.parms_id() == parms_id)
+        {
+            return;
+        }
+
+        if (context_data_ptr->parms().scheme() == scheme_type::ckks)
+        {
+            // Modulus switching without scaling only discards RNS components, so drop all levels at once
+            if (!is_metadata_valid_for(encrypted, context_) || !is_buffer_valid(encrypted))
+            {
+                throw invalid_argument("encrypted is not valid for encryption parameters");
+            }
+            if (!pool)
+            {
+                throw invalid_argument("pool is uninitialized");
+            }
+
+            mod_switch_drop_to(encrypted, encrypted, *target_context_data_ptr, move(pool));
+#ifdef SEAL_THROW_ON_TRANSPARENT_CIPHERTEXT
+            // Transparent ciphertext output is not allowed.
+            if (encrypted.is_transparent())
+            {
+                throw logic_error("result ciphertext is transparent");
+            }
+#endif
+            return;
+        }
+
         while (encrypted.parms_id() != parms_id)
         {
             mod_switch_to_next_inplace(encrypted, pool);
@@ -1221,7 +1221,9 @@ namespace seal
         void mod_switch_scale_to_next(
             const Ciphertext &encrypted, Ciphertext &destination, MemoryPoolHandle pool) const;
 
-        void mod_switch_drop_to_next(const Ciphertext &encrypted, Ciphertext &destination, MemoryPoolHandle pool) const;
+        void mod_switch_drop_to(
+            const Ciphertext &encrypted, Ciphertext &destination, const SEALContext::ContextData &target_context_data,
+            MemoryPoolHandle pool) const;
 
         void mod_switch_drop_to_next(Plaintext &plain) const;
 
@@ -2927,6 +2927,77 @@ namespace sealtest
             }
         }
     }
+    TEST(EvaluatorTest, CKKSEncryptModSwitchToDecrypt)
+    {
+        EncryptionParameters parms(scheme_type::ckks);
+        size_t slot_size = 32;
+        parms.set_poly_modulus_degree(slot_size * 2);
+        parms.set_coeff_modulus(CoeffModulus::Create(slot_size * 2, { 60, 60, 60, 60, 60 }));
+
+        SEALContext context(parms, true, sec_level_type::none);
+        KeyGenerator keygen(context);
+        PublicKey pk;
+        keygen.create_public_key(pk);
+
+        CKKSEncoder encoder(context);
+        Encryptor encryptor(context, pk);
+        Decryptor decryptor(context, keygen.secret_key());
+        Evaluator evaluator(context);
+
+        // The last level has a single 60-bit prime, so keep the encoded values well below it
+        int data_bound = 1 << 10;
+        srand(static_cast<unsigned>(time(NULL)));
+
+        vector<complex<double>> input(slot_size, 0.0);
+        vector<complex<double>> output(slot_size);
+        for (size_t i = 0; i < slot_size; i++)
+        {
+            input[i] = static_cast<double>(rand() % data_bound);
+        }
+
+        double delta = static_cast<double>(1ULL << 40);
+        Plaintext plain;
+        encoder.encode(input, context.first_parms_id(), delta, plain);
+
+        Ciphertext encrypted;
+        encryptor.encrypt(plain, encrypted);
+
+        // Switching to the current parms_id does nothing
+        Ciphertext destination;
+        evaluator.mod_switch_to(encrypted, context.first_parms_id(), destination);
+        ASSERT_TRUE(destination.parms_id() == context.first_parms_id());
+        ASSERT_TRUE(equal(encrypted.data(), encrypted.data() + encrypted.dyn_array().size(), destination.data()));
+
+        // Dropping several levels at once must match dropping them one at a time
+        Ciphertext expected = encrypted;
+        while (expected.parms_id() != context.last_parms_id())
+        {
+            evaluator.mod_switch_to_next_inplace(expected);
+        }
+
+        evaluator.mod_switch_to(encrypted, context.last_parms_id(), destination);
+        ASSERT_TRUE(destination.parms_id() == context.last_parms_id());
+        ASSERT_EQ(expected.dyn_array().size(), destination.dyn_array().size());
+        ASSERT_TRUE(equal(expected.data(), expected.data() + expected.dyn_array().size(), destination.data()));
+        ASSERT_EQ(expected.scale(), destination.scale());
+
+        evaluator.mod_switch_to_inplace(encrypted, context.last_parms_id());
+        ASSERT_TRUE(encrypted.parms_id() == context.last_parms_id());
+        ASSERT_EQ(expected.dyn_array().size(), encrypted.dyn_array().size());
+        ASSERT_TRUE(equal(expected.data(), expected.data() + expected.dyn_array().size(), encrypted.data()));
+
+        decryptor.decrypt(encrypted, plain);
+        encoder.decode(plain, output);
+        for (size_t i = 0; i < slot_size; i++)
+        {
+            auto tmp = abs(input[i].real() - output[i].real());
+            ASSERT_TRUE(tmp < 0.5);
+        }
+
+        // Cannot switch back up the chain
+        ASSERT_THROW(evaluator.mod_switch_to_inplace(encrypted, context.first_parms_id()), invalid_argument);
+    }
+
     TEST(EvaluatorTest, CKKSEncryptMultiplyRelinRescaleModSwitchAddDecrypt)
     {
         EncryptionParameters parms(scheme_type::ckks);